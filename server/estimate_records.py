@@ -4,34 +4,65 @@ Sample Reddit zst file to understand content and test filtering.
 Shows actual comment data and validates filtering logic.
 """
 
+import itertools
 import pathlib
-import json
-import zstandard as zstd
 import time
 from datetime import datetime, timezone
+from typing import Iterator
+
+from reddit_election_night_2024 import (
+    ELECTION_END,
+    ELECTION_END_TS,
+    ELECTION_START,
+    ELECTION_START_TS,
+    stream_lines,
+)
+
+# Same fallback as the loader; both raise a ValueError on bad JSON
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+# '%Y-%m-%d %H:%M UTC' labels keyed by minute (created_utc // 60)
+_minute_bucket_cache: dict[int, str] = {}
+
+def format_minute(created_utc: int) -> str:
+    """Format a timestamp to the minute, building each label only once."""
+    key = created_utc // 60
+    label = _minute_bucket_cache.get(key)
+    if label is None:
+        dt = datetime.fromtimestamp(key * 60, tz=timezone.utc)
+        label = _minute_bucket_cache[key] = dt.strftime('%Y-%m-%d %H:%M UTC')
+    return label
+
+def iter_records(zst_path: pathlib.Path) -> Iterator[dict]:
+    """Yield the parsed comments of the archive, skipping malformed lines."""
+    for line in stream_lines(zst_path):
+        try:
+            yield orjson.loads(line)
+        except ValueError:
+            continue
 
 def is_election_night_comment(obj: dict) -> bool:
     """Test version of election night filter."""
-    # Only top-level comments (replies to posts, not other comments)
-    if obj.get('parent_id', '').startswith('t3_'):
-        created_utc = obj.get('created_utc', 0)
-        # Election Day (Nov 5, 2024 00:00 UTC) to 3am ET Nov 6 (08:00 UTC)
-        election_start = 1730764800  # Nov 5, 2024 00:00 UTC
-        election_end = 1730880000    # Nov 6, 2024 08:00 UTC (3am ET)
-        
-        # All top-level comments in this time range, no other filtering
-        return election_start <= created_utc <= election_end
-    
-    return False
+    # All top-level comments (replies to posts, not other comments) in the
+    # shared election window, no other filtering
+    created_utc = obj.get('created_utc', 0)
+    return (
+        ELECTION_START_TS <= created_utc < ELECTION_END_TS
+        and obj.get('parent_id', '').startswith('t3_')
+    )
 
 def sample_and_analyze(zst_path: pathlib.Path, sample_records: int = 50000):
     """Sample records and analyze content for filtering validation."""
     
     print(f"📊 Analyzing Reddit data: {zst_path}")
     print(f"🔍 Sampling first {sample_records:,} records...")
-    print(f"🎯 Election period: Nov 5, 2024 00:00 UTC to Nov 6, 2024 08:00 UTC")
-    
-    dctx = zstd.ZstdDecompressor(max_window_size=2**31)
+    print(
+        f"🎯 Election period: {ELECTION_START:%b %-d, %Y %H:%M} UTC"
+        f" to {ELECTION_END:%b %-d, %Y %H:%M} UTC"
+    )
     
     # Track various stats
     total_sampled = 0
@@ -43,74 +74,55 @@ def sample_and_analyze(zst_path: pathlib.Path, sample_records: int = 50000):
     
     start_time = time.time()
     
-    with open(zst_path, "rb") as fh:
-        with dctx.stream_reader(fh) as reader:
-            import io
-            text_stream = io.TextIOWrapper(reader, encoding='utf-8')
+    try:
+        # Reuse the loader's decode path; islice bounds the sample of
+        # parsed records, so skipped lines don't count towards it
+        for obj in itertools.islice(iter_records(zst_path), sample_records):
+            total_sampled += 1
             
-            try:
-                for line in text_stream:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    
-                    total_sampled += 1
-                    
-                    # Collect date samples
-                    created_utc = obj.get('created_utc', 0)
-                    if created_utc > 0 and len(date_samples) < 20:
-                        dt = datetime.fromtimestamp(created_utc, tz=timezone.utc)
-                        date_samples.append((created_utc, dt.strftime('%Y-%m-%d %H:%M UTC')))
-                    
-                    # Check if top-level comment
-                    parent_id = obj.get('parent_id', '')
-                    is_top_level = parent_id.startswith('t3_')
-                    
-                    if is_top_level:
-                        top_level_comments += 1
-                        
-                        # Test election filter
-                        if is_election_night_comment(obj):
-                            election_matches += 1
-                            if len(example_election_comments) < 3:
-                                dt = datetime.fromtimestamp(created_utc, tz=timezone.utc)
-                                example_election_comments.append({
-                                    'timestamp': dt.strftime('%Y-%m-%d %H:%M UTC'),
-                                    'subreddit': obj.get('subreddit', 'unknown'),
-                                    'author': obj.get('author', 'unknown'),
-                                    'score': obj.get('score', 0),
-                                    'body': obj.get('body', '')[:200] + '...' if len(obj.get('body', '')) > 200 else obj.get('body', '')
-                                })
-                    
-                    # Collect example comments
-                    if len(example_comments) < 5:
-                        dt = datetime.fromtimestamp(created_utc, tz=timezone.utc) if created_utc > 0 else None
-                        example_comments.append({
-                            'timestamp': dt.strftime('%Y-%m-%d %H:%M UTC') if dt else 'unknown',
+            # Collect date samples
+            created_utc = obj.get('created_utc', 0)
+            if created_utc > 0 and len(date_samples) < 20:
+                date_samples.append((created_utc, format_minute(created_utc)))
+            
+            # Check if top-level comment
+            parent_id = obj.get('parent_id', '')
+            is_top_level = parent_id.startswith('t3_')
+            
+            if is_top_level:
+                top_level_comments += 1
+                
+                # Test election filter
+                if is_election_night_comment(obj):
+                    election_matches += 1
+                    if len(example_election_comments) < 3:
+                        example_election_comments.append({
+                            'timestamp': format_minute(created_utc),
                             'subreddit': obj.get('subreddit', 'unknown'),
-                            'parent_id': parent_id,
-                            'is_top_level': is_top_level,
-                            'body': obj.get('body', '')[:100] + '...' if len(obj.get('body', '')) > 100 else obj.get('body', '')
+                            'author': obj.get('author', 'unknown'),
+                            'score': obj.get('score', 0),
+                            'body': obj.get('body', '')[:200] + '...' if len(obj.get('body', '')) > 200 else obj.get('body', '')
                         })
-                    
-                    # Stop when we've sampled enough
-                    if total_sampled >= sample_records:
-                        break
-                        
-                    # Show progress
-                    if total_sampled % 10000 == 0:
-                        elapsed = time.time() - start_time
-                        rate = total_sampled / elapsed if elapsed > 0 else 0
-                        print(f"   Progress: {total_sampled:,} sampled, {top_level_comments:,} top-level, {election_matches} election matches ({rate:.0f}/sec)")
-                
-            except Exception as e:
-                print(f"❌ Error during sampling: {e}")
-                return None
+            
+            # Collect example comments
+            if len(example_comments) < 5:
+                example_comments.append({
+                    'timestamp': format_minute(created_utc) if created_utc > 0 else 'unknown',
+                    'subreddit': obj.get('subreddit', 'unknown'),
+                    'parent_id': parent_id,
+                    'is_top_level': is_top_level,
+                    'body': obj.get('body', '')[:100] + '...' if len(obj.get('body', '')) > 100 else obj.get('body', '')
+                })
+            
+            # Show progress
+            if total_sampled % 10000 == 0:
+                elapsed = time.time() - start_time
+                rate = total_sampled / elapsed if elapsed > 0 else 0
+                print(f"   Progress: {total_sampled:,} sampled, {top_level_comments:,} top-level, {election_matches} election matches ({rate:.0f}/sec)")
+    
+    except Exception as e:
+        print(f"❌ Error during sampling: {e}")
+        return None
     
     elapsed = time.time() - start_time
     
@@ -2,14 +2,20 @@
 
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
 import json
-import io
+import polars as pl
 import pyarrow as pa
 from reddit_election_night_2024 import get_reddit_df
 
-app = FastAPI(title="Observatory API - Simple", version="0.1.0")
+app = FastAPI(
+    title="Observatory API - Simple",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,7 +26,11 @@ app.add_middleware(
 )
 
 # Global data storage
-reddit_df = None
+reddit_df = None  # sorted by score, descending
+subreddit_groups: dict[str, pl.DataFrame] = {}  # same order, split by subreddit
+subreddit_names: list[str] = []  # sorted; the data never changes after startup
+loading_state = {"processed": 0, "matched": 0, "rate": 0, "done": False, "error": None}
+loading_task = None  # keeps the background load task referenced
 
 class RedditComment(BaseModel):
     id: str
@@ -38,19 +48,48 @@ class RedditCommentsResponse(BaseModel):
     page: int
     per_page: int
 
-@app.on_event("startup")
-async def startup_event():
-    """Load Reddit data on startup."""
-    global reddit_df
+def update_loading_progress(processed: int, matched: int, rate: float):
+    """Progress callback for get_reddit_df; feeds /reddit/loading-status."""
+    loading_state.update(processed=processed, matched=matched, rate=rate)
+
+def load_reddit_data():
+    """Load, sort and index the Reddit data (blocking; runs off the event loop)."""
+    global reddit_df, subreddit_groups, subreddit_names
     print("Loading Reddit data...")
-    reddit_df = get_reddit_df()
+    # Sort once here so every page request is a plain slice; null scores go
+    # last so min_score can cut the frame at a single sorted position
+    df = get_reddit_df(progress_callback=update_loading_progress).sort(
+        "score", descending=True, nulls_last=True
+    )
+    subreddit_groups = {
+        group["subreddit"][0]: group for group in df.partition_by("subreddit")
+    }
+    subreddit_names = sorted(subreddit_groups)
+    reddit_df = df
+    loading_state["done"] = True
     print(f"Loaded {reddit_df.shape[0]} comments")
 
+async def load_reddit_data_async():
+    """Run load_reddit_data in the default executor, recording failures."""
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, load_reddit_data)
+    except Exception as e:
+        loading_state["error"] = str(e)
+        print(f"Error loading Reddit data: {e}")
+
+@app.on_event("startup")
+async def startup_event():
+    """Start loading Reddit data in the background so the server answers at once."""
+    global loading_task
+    loading_task = asyncio.create_task(load_reddit_data_async())
+
 @app.get("/")
 async def root():
     return {"message": "Observatory API - Simple"}
 
-@app.get("/reddit/comments")
+# The model only documents the JSON shape; the handler serializes the page
+# itself, so rows never go through Pydantic validation.
+@app.get("/reddit/comments", response_model=RedditCommentsResponse)
 async def get_reddit_comments(
     page: int = 1,
     per_page: int = 100,
@@ -60,53 +99,61 @@ async def get_reddit_comments(
     format: str = "json"
 ):
     """Get paginated Reddit comments with filtering."""
-    global reddit_df
-    
-    if reddit_df is None:
-        return {"error": "No data loaded"}
-    
-    # Apply filters
-    filtered_df = reddit_df
+    global reddit_df, subreddit_groups
     
+    if loading_state["error"] is not None:
+        return ORJSONResponse({"error": loading_state["error"]}, status_code=500)
+    if not loading_state["done"]:
+        return ORJSONResponse({"error": "loading"}, status_code=503)
+
+    # Build one lazy query; every frame is already sorted by score descending
+    # and filtering keeps that order
     if subreddit:
-        filtered_df = filtered_df.filter(filtered_df["subreddit"] == subreddit)
-    
-    if author:
-        filtered_df = filtered_df.filter(filtered_df["author"] == author)
+        base_df = subreddit_groups.get(subreddit)
+        if base_df is None:  # unknown subreddit: empty page, same schema
+            base_df = reddit_df.clear()
+    else:
+        base_df = reddit_df
     
     if min_score is not None:
-        filtered_df = filtered_df.filter(filtered_df["score"] >= min_score)
+        # Sorted by score (nulls last), so the matching rows are a prefix:
+        # binary-search its end and take a zero-copy head instead of
+        # filtering (and gathering) every column. Clamp to the non-null
+        # rows: search_sorted lands past the nulls when they are all that's left
+        scores = base_df["score"]
+        cut = scores.search_sorted(min_score, side="right", descending=True)
+        base_df = base_df.head(min(cut, base_df.height - scores.null_count()))
     
-    # Sort by score descending
-    filtered_df = filtered_df.sort("score", descending=True)
+    filtered_lf = base_df.lazy()
     
-    total = filtered_df.shape[0]
+    if author:
+        filtered_lf = filtered_lf.filter(pl.col("author") == author)
     
-    # Pagination
+    # Count and paginate in a single collect so the filters run once
     offset = (page - 1) * per_page
-    paginated_df = filtered_df.slice(offset, per_page)
+    total_df, paginated_df = pl.collect_all([
+        filtered_lf.select(pl.len()),
+        filtered_lf.slice(offset, per_page)
+    ])
+    total = total_df.item()
     
     if format.lower() == "arrow":
         # Return Arrow format
-        # Convert to Arrow table with metadata
-        arrow_df = paginated_df.to_arrow()
-        
-        # Add metadata columns
-        arrow_df = arrow_df.append_column(
-            'total', pa.array([total] * len(arrow_df))
-        ).append_column(
-            'page', pa.array([page] * len(arrow_df))
-        ).append_column(
-            'per_page', pa.array([per_page] * len(arrow_df))
-        )
+        # total/page/per_page go in the schema metadata (and the headers)
+        # rather than as columns repeating one value on every row
+        arrow_df = paginated_df.to_arrow().replace_schema_metadata({
+            "total": str(total),
+            "page": str(page),
+            "per_page": str(per_page)
+        })
         
-        # Serialize to IPC format (Feather)
-        buffer = io.BytesIO()
-        with pa.ipc.new_file(buffer, arrow_df.schema) as writer:
+        # Serialize to IPC format (Feather) straight into an Arrow buffer
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, arrow_df.schema) as writer:
             writer.write_table(arrow_df)
         
         return Response(
-            content=buffer.getvalue(),
+            content=memoryview(sink.getvalue()),
             media_type="application/vnd.apache.arrow.file",
             headers={
                 "X-Total-Count": str(total),
@@ -115,42 +162,41 @@ async def get_reddit_comments(
             }
         )
     else:
-        # Return JSON format
-        comments = []
-        for row in paginated_df.to_dicts():
-            comments.append(RedditComment(**row))
+        # Return JSON format; Polars writes the rows straight from its
+        # columns, without building a Python dict per row
+        content = b"".join((
+            b'{"comments":',
+            paginated_df.write_json().encode(),
+            b',"total":%d,"page":%d,"per_page":%d}' % (total, page, per_page)
+        ))
         
-        return RedditCommentsResponse(
-            comments=comments,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
+        return Response(content=content, media_type="application/json")
 
 @app.get("/reddit/subreddits")
 async def get_subreddits():
     """Get list of unique subreddits."""
-    global reddit_df
+    global subreddit_names
     
-    if reddit_df is None:
-        return []
-    
-    subreddits = reddit_df.select("subreddit").unique().to_series().to_list()
-    return sorted(subreddits)
+    return subreddit_names
 
 @app.get("/reddit/loading-status")
 async def get_reddit_loading_status():
     """Get the current loading status of Reddit data."""
     global reddit_df
     
-    if reddit_df is None:
+    if not loading_state["done"]:
+        error = loading_state["error"]
+        if error:
+            message = f"Failed to load data: {error}"
+        else:
+            message = "Loading Reddit data..."
         return {
-            "is_loading": False,
+            "is_loading": error is None,
             "progress": 0,
-            "message": "No data loaded",
-            "total_processed": 0,
-            "total_matched": 0,
-            "rate": 0
+            "message": message,
+            "total_processed": loading_state["processed"],
+            "total_matched": loading_state["matched"],
+            "rate": loading_state["rate"]
         }
     else:
         return {